@@ -2,10 +2,12 @@
 Application Configuration
 Centralized configuration management using Pydantic Settings
 """
+import os
 import secrets
-from typing import List, Optional
+from functools import cached_property
+from typing import Any, FrozenSet, Optional
 
-from pydantic import AnyHttpUrl, Field, field_validator
+from pydantic import AnyHttpUrl, Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -17,8 +19,34 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=True,
         extra="ignore",
+        frozen=True,
     )
     
+    # Derived values below are cached with cached_property in the instance
+    # __dict__, so copies and comparisons must skip them.
+    def model_copy(
+        self, *, update: Optional[dict[str, Any]] = None, deep: bool = False
+    ) -> "Settings":
+        """Copy settings without values cached from the original"""
+        copied = super().model_copy(update=update, deep=deep)
+        for name, attr in vars(type(self)).items():
+            if isinstance(attr, cached_property):
+                copied.__dict__.pop(name, None)
+        return copied
+    
+    def _field_values(self) -> tuple:
+        """Return the field values, excluding cached derived values"""
+        return tuple(self.__dict__[name] for name in self.model_fields)
+    
+    def __eq__(self, other: object) -> bool:
+        """Compare settings by field values only"""
+        if not isinstance(other, Settings):
+            return NotImplemented
+        return self._field_values() == other._field_values()
+    
+    def __hash__(self) -> int:
+        return hash((self.__class__, self._field_values()))
+    
     # Application
     PROJECT_NAME: str = "High Availability 3-Tier App"
     VERSION: str = "1.0.0"
@@ -32,6 +60,9 @@ class Settings(BaseSettings):
     API_TIMEOUT: int = 60
     
     # Security
+    # Fallback keys are generated once when Settings is built (in the gunicorn
+    # master under preload_app) so every forked worker shares the same key.
+    # pydantic only calls the factory when the variable is not set.
     SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     JWT_SECRET_KEY: str = Field(default_factory=lambda: secrets.token_urlsafe(32))
     JWT_ALGORITHM: str = "HS256"
@@ -39,17 +70,11 @@ class Settings(BaseSettings):
     JWT_REFRESH_TOKEN_EXPIRE_DAYS: int = 7
     
     # CORS
-    CORS_ORIGINS: List[str] = Field(
-        default=["http://localhost:3000", "http://localhost:8080"]
+    # Set from the environment as JSON lists, e.g. '["https://example.com"]'
+    CORS_ORIGINS: FrozenSet[str] = Field(
+        default=frozenset({"http://localhost:3000", "http://localhost:8080"})
     )
-    ALLOWED_HOSTS: List[str] = Field(default=["*"])
-    
-    @field_validator("CORS_ORIGINS", mode="before")
-    @classmethod
-    def assemble_cors_origins(cls, v: str | List[str]) -> List[str]:
-        if isinstance(v, str):
-            return [i.strip() for i in v.split(",")]
-        return v
+    ALLOWED_HOSTS: FrozenSet[str] = Field(default=frozenset({"*"}))
     
     # MySQL/RDS Configuration
     MYSQL_HOST: str = Field(default="localhost")
@@ -61,13 +86,15 @@ class Settings(BaseSettings):
     MYSQL_MAX_OVERFLOW: int = 30
     MYSQL_SSL_MODE: str = "REQUIRED"
     
-    @property
+    @cached_property
     def MYSQL_DATABASE_URI(self) -> str:
         """Construct MySQL connection URI"""
+        ssl_param = "?ssl=true" if self.MYSQL_SSL_MODE == "REQUIRED" else ""
+        
         return (
             f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}"
             f"@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
-            f"?ssl=true" if self.MYSQL_SSL_MODE == "REQUIRED" else ""
+            f"{ssl_param}"
         )
     
     # MongoDB Configuration
@@ -80,7 +107,7 @@ class Settings(BaseSettings):
     MONGODB_SSL: bool = True
     MONGODB_AUTH_SOURCE: str = "admin"
     
-    @property
+    @cached_property
     def MONGODB_URI(self) -> str:
         """Construct MongoDB connection URI"""
         ssl_param = "?ssl=true&ssl_cert_reqs=CERT_NONE" if self.MONGODB_SSL else ""
@@ -101,7 +128,7 @@ class Settings(BaseSettings):
     REDIS_SSL: bool = False
     REDIS_CLUSTER_MODE: bool = False
     
-    @property
+    @cached_property
     def REDIS_URI(self) -> str:
         """Construct Redis connection URI"""
         protocol = "rediss" if self.REDIS_SSL else "redis"
@@ -158,6 +185,8 @@ class Settings(BaseSettings):
     # Feature Flags
     ENABLE_SWAGGER: bool = True
     ENABLE_PROFILING: bool = False
+    # Disable gzip when a proxy in front already compresses responses
+    ENABLE_GZIP: bool = True
     VERBOSE_LOGGING: bool = False
     
     # Email Configuration
@@ -172,11 +201,11 @@ class Settings(BaseSettings):
     CELERY_BROKER_URL: Optional[str] = None
     CELERY_RESULT_BACKEND: Optional[str] = None
     
-    @property
+    @cached_property
     def CELERY_BROKER_URL_DEFAULT(self) -> str:
         return self.CELERY_BROKER_URL or self.REDIS_URI
     
-    @property
+    @cached_property
     def CELERY_RESULT_BACKEND_DEFAULT(self) -> str:
         return self.CELERY_RESULT_BACKEND or self.REDIS_URI
     
@@ -186,8 +215,9 @@ class Settings(BaseSettings):
     
     # File Upload
     MAX_UPLOAD_SIZE: int = 10 * 1024 * 1024  # 10 MB
-    ALLOWED_UPLOAD_EXTENSIONS: List[str] = Field(
-        default=[".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx"]
+    # Set from the environment as a JSON list, e.g. '[".png", ".gif"]'
+    ALLOWED_UPLOAD_EXTENSIONS: FrozenSet[str] = Field(
+        default=frozenset({".jpg", ".jpeg", ".png", ".pdf", ".doc", ".docx"})
     )
 
 
@@ -195,27 +225,31 @@ class Settings(BaseSettings):
 settings = Settings()
 
 
-# Validate critical settings on startup
-def validate_settings():
+# Validate critical settings
+def validate_settings(config: Optional[Settings] = None):
     """Validate critical configuration settings"""
+    if config is None:
+        config = settings
     errors = []
     
-    if settings.ENVIRONMENT == "production":
-        if settings.DEBUG:
+    if config.ENVIRONMENT == "production":
+        if config.DEBUG:
             errors.append("DEBUG should be False in production")
         
-        if settings.SECRET_KEY == "changeme":
+        if config.SECRET_KEY == "changeme":
             errors.append("SECRET_KEY must be changed in production")
         
-        if settings.MYSQL_PASSWORD == "password":
+        if config.MYSQL_PASSWORD == "password":
             errors.append("MYSQL_PASSWORD must be changed in production")
         
-        if settings.MONGODB_PASSWORD == "password":
+        if config.MONGODB_PASSWORD == "password":
             errors.append("MONGODB_PASSWORD must be changed in production")
     
     if errors:
         raise ValueError(f"Configuration errors: {', '.join(errors)}")
 
 
-# Validate on import
-validate_settings()
+# Validation runs once in the gunicorn master (see gunicorn.conf.py);
+# opt in on import for other entrypoints
+if os.getenv("RUN_CONFIG_VALIDATION", "").lower() in {"1", "true", "yes"}:
+    validate_settings()
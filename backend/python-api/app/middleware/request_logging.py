@@ -0,0 +1,150 @@
+"""
+Request Logging Middleware
+Logs requests and records Prometheus metrics as a pure ASGI middleware
+"""
+import logging
+import time
+from functools import lru_cache
+from typing import Any, Optional
+
+from prometheus_client import Counter, Histogram
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+logger = logging.getLogger(__name__)
+
+# Prometheus metrics
+REQUEST_COUNT = Counter(
+    "http_requests_total",
+    "Total HTTP requests",
+    ["method", "endpoint", "status"],
+)
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency",
+    ["method", "endpoint"],
+)
+
+# Endpoint label for requests that matched no route (404s, scanners)
+UNMATCHED_ENDPOINT = "<unmatched>"
+# Endpoint label for routed requests whose path template is not found
+UNRESOLVED_ENDPOINT = "<unresolved>"
+
+
+@lru_cache(maxsize=1024)
+def _request_count(method: str, endpoint: str, status_code: int):
+    """Return the cached REQUEST_COUNT child for a label combination"""
+    return REQUEST_COUNT.labels(
+        method=method,
+        endpoint=endpoint,
+        status=status_code,
+    )
+
+
+@lru_cache(maxsize=1024)
+def _request_latency(method: str, endpoint: str):
+    """Return the cached REQUEST_LATENCY child for a label combination"""
+    return REQUEST_LATENCY.labels(method=method, endpoint=endpoint)
+
+
+@lru_cache(maxsize=256)
+def _route_template(app: ASGIApp, endpoint: Any) -> str:
+    """Return the path template of the app route serving endpoint"""
+    for route in getattr(app, "routes", ()):
+        if getattr(route, "endpoint", None) is endpoint:
+            return route.path
+    return UNRESOLVED_ENDPOINT
+
+
+def _endpoint_label(scope: Scope) -> str:
+    """Return the matched route template, keeping label cardinality bounded"""
+    # FastAPI routes store themselves in the scope
+    route = scope.get("route")
+    if route is not None:
+        return route.path
+
+    # Plain Starlette routes (e.g. /api/docs) only set the endpoint
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return UNMATCHED_ENDPOINT
+    return _route_template(scope.get("app"), endpoint)
+
+
+def _request_id(scope: Scope) -> Optional[Any]:
+    """Return the request ID stored on request.state by RequestIDMiddleware"""
+    return scope.get("state", {}).get("request_id")
+
+
+class RequestLoggingMiddleware:
+    """Log all requests and track metrics"""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(
+        self,
+        scope: Scope,
+        receive: Receive,
+        send: Send,
+    ) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start_time = time.perf_counter_ns()
+        method = scope["method"]
+        path = scope["path"]
+        status_code = 500
+
+        # Log request (request ID is not assigned yet at this point)
+        if logger.isEnabledFor(logging.DEBUG):
+            client = scope.get("client")
+            logger.debug(
+                f"Request started: {method} {path}",
+                extra={
+                    "method": method,
+                    "path": path,
+                    "client_ip": client[0] if client else None,
+                },
+            )
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                # Add timing header
+                duration = (time.perf_counter_ns() - start_time) / 1e9
+                headers = MutableHeaders(scope=message)
+                headers.append("X-Process-Time", f"{duration:.6f}")
+            await send(message)
+
+        # Process request
+        try:
+            await self.app(scope, receive, send_with_timing)
+        except Exception as exc:
+            logger.error(
+                f"Request failed: {method} {path}",
+                extra={
+                    "request_id": _request_id(scope),
+                    "error": str(exc),
+                },
+                exc_info=True,
+            )
+            raise
+        finally:
+            # Update metrics; failed requests keep the default 500 status
+            duration = (time.perf_counter_ns() - start_time) / 1e9
+            endpoint = _endpoint_label(scope)
+            _request_count(method, endpoint, status_code).inc()
+            _request_latency(method, endpoint).observe(duration)
+
+        # Log response
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Request completed: {method} {path}",
+                extra={
+                    "request_id": _request_id(scope),
+                    "status_code": status_code,
+                    "duration": duration,
+                },
+            )
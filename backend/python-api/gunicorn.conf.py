@@ -0,0 +1,29 @@
+"""
+Gunicorn Configuration
+Production process manager running Uvicorn workers
+"""
+from app.core.config import settings, validate_settings
+
+# Server socket
+bind = f"{settings.API_HOST}:{settings.API_PORT}"
+
+# Worker processes
+worker_class = "uvicorn.workers.UvicornWorker"
+workers = settings.API_WORKERS
+timeout = settings.API_TIMEOUT
+
+# Import the application once in the master and fork workers from it,
+# so imported modules are shared copy-on-write instead of loaded per worker.
+# Nothing opens sockets or connections at import; the lifespan handler
+# connects to the databases inside each worker after the fork.
+preload_app = True
+
+# Logging
+loglevel = settings.LOG_LEVEL.lower()
+accesslog = "-"
+errorlog = "-"
+
+
+def on_starting(server):
+    """Validate the runtime configuration once before forking workers"""
+    validate_settings()